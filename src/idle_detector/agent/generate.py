@@ -1,11 +1,19 @@
 import plistlib
 from dataclasses import dataclass
+from functools import cached_property, lru_cache
 from pathlib import Path
 from typing import ClassVar
 
 from ..models.machine import MacOS
 from ..utils.common import PROJECT, decode_string, type_name
-from ..utils.os_modules import find_package, get_sys_path, rm_file
+from ..utils.os_modules import (
+    find_package,
+    get_home_dir,
+    get_sys_path,
+    is_file,
+    rm_file,
+    write_bytes,
+)
 
 
 @dataclass(init=False)
@@ -13,52 +21,69 @@ class AgentGenerator:
     PACKAGE_NAME: ClassVar[str] = "idle-detector"
     AGENT_LABEL: ClassVar[str] = f"com.github.{PROJECT}"
     AGENT_PATH: ClassVar[Path] = (
-        Path("~/Library/LaunchAgents/") / AGENT_LABEL
-    ).expanduser()
-    agent_file: ClassVar[Path] = AGENT_PATH.with_name(AGENT_PATH.name + ".plist")
+        Path(f"{get_home_dir()}/Library/LaunchAgents") / AGENT_LABEL
+    )
+    # Kept as a plain string; only wrapped in `Path` where a pathlib API is needed.
+    agent_file: ClassVar[str] = f"{AGENT_PATH}.plist"
 
     def __str__(self):
         return "{}(agent_file={!r})".format(type_name(self), self.agent_file)
 
     def agent_file_exists(self):
-        return self.agent_file.exists()
+        return is_file(self.agent_file)
 
     def generate_data(self):
+        return self.agent_data(self.idle_detector_bin, get_sys_path())
+
+    @classmethod
+    @lru_cache(maxsize=1)
+    def agent_data(cls, program: str, sys_path: str):
+        """
+        Build the LaunchAgent plist payload (memoized per program/PATH pair).
+        The returned dict is shared across calls and must be treated as read-only.
+        """
         log_paths = MacOS.log_files()
         return {
-            "Label": self.AGENT_LABEL,
-            "ProgramArguments": [self.idle_detector_bin],
-            "EnvironmentVariables": {"PATH": get_sys_path()},
+            "Label": cls.AGENT_LABEL,
+            "ProgramArguments": [program],
+            "EnvironmentVariables": {"PATH": sys_path},
             "RunAtLoad": True,
             "KeepAlive": True,
             "StandardOutPath": log_paths.out_log.as_posix(),
             "StandardErrorPath": log_paths.err_log.as_posix(),
         }
 
-    def read_agent(self, xml_format: bool = True):
+    def read_agent(self, *, xml_format: bool = True, as_str: bool = False):
+        """
+        Return the agent's plist.
+
+        With `xml_format=True` the XML rendering is returned as raw bytes
+        (decoded only when `as_str=True`); otherwise the agent file is loaded
+        and returned as a dict.
+        """
         if not self.agent_file_exists():
             return
 
-        with self.agent_file.open("rb") as af:
-            if xml_format:
-                af_xml = plistlib.dumps(
-                    self.generate_data(), fmt=plistlib.FMT_XML, sort_keys=False
-                )
-                return decode_string(af_xml)
-            return plistlib.load(af, fmt=plistlib.FMT_XML)
+        if xml_format:
+            # Rendered from the generated data; the file itself is not read.
+            af_xml = plistlib.dumps(
+                self.generate_data(), fmt=plistlib.FMT_XML, sort_keys=False
+            )
+            return decode_string(af_xml) if as_str else af_xml
+
+        with open(self.agent_file, "rb") as af:
+            # Format is auto-detected (binary or legacy XML agent files).
+            return plistlib.load(af)
 
     def build_agent(self):
-        with self.agent_file.open("wb") as af:
-            plistlib.dump(
-                self.generate_data(),
-                af,
-                fmt=plistlib.FMT_XML,
-                sort_keys=False,
-            )
+        # `launchctl` accepts binary plists, which are smaller and faster to write.
+        # The payload is serialized in memory and written with a single syscall.
+        payload = plistlib.dumps(self.generate_data(), fmt=plistlib.FMT_BINARY)
+        write_bytes(self.agent_file, payload)
 
     def delete_agent(self):
         rm_file(self.agent_file)
 
-    @property
+    @cached_property
     def idle_detector_bin(self):
         return find_package(self.PACKAGE_NAME, default="")
@@ -5,18 +5,29 @@ from ..utils.common import type_name
 from ..utils.exceptions import MissingPackage
 from ..utils.os_modules import (
     find_package,
+    get_env,
     getuid,
+    is_file,
     run_process,
 )
 from .generate import AgentGenerator
 
+# Default location of the `launchctl` binary on macOS.
+LAUNCHCTL_PATH = "/bin/launchctl"
+
+# `launchctl` only needs the user's identity; built once instead of handing
+# every invocation a copy of the full environment.
+LAUNCHCTL_ENV = {
+    key: value for key in ("HOME", "USER") if (value := get_env(key)) is not None
+}
+
 
 def agent_must_exist(func):
     @wraps(func)
     def wrapper(self):
         if not self.agent_file_exists():
             raise FileNotFoundError(
-                f"The agent file does not exist at: {self.agent_file.as_posix()}"
+                f"The agent file does not exist at: {self.agent_file}"
             )
         return func(self)
 
@@ -73,8 +84,11 @@ class AgentInstaller(AgentGenerator):
             subprocess.CompletedProcess: The result of the `launchctl` command.
         """
         boot_type = "bootout" if bootout else "bootstrap"
-        cmd = [boot_type, self.guid, self.agent_file.as_posix()]
-        return self.execute_launchctl(cmd)
+        cmd = [boot_type, self.guid, self.agent_file]
+        boot_process = self.execute_launchctl(cmd)
+        # The loaded state has changed; the next check must query `launchctl` again.
+        self.reset_booted_state()
+        return boot_process
 
     def __control_agent(self, *, disable: bool = False, start: bool = False):
         """
@@ -96,17 +110,19 @@ class AgentInstaller(AgentGenerator):
         cmd = [control_type, label]
         return self.execute_launchctl(cmd)
 
-    def execute_launchctl(self, cmd):
+    def execute_launchctl(self, cmd, **kwargs):
         """
         Execute a `launchctl` command.
 
         Args:
             cmd (list[str]): List of arguments to pass to the `launchctl` binary.
+            **kwargs: Extra keyword arguments forwarded to `run_process`.
 
         Returns:
             subprocess.CompletedProcess: The result of the executed command.
         """
-        return run_process([self.launchctl_bin, *cmd], start_new_session=True)
+        kwargs.setdefault("env", LAUNCHCTL_ENV)
+        return run_process([self.launchctl_bin, *cmd], start_new_session=True, **kwargs)
 
     @agent_must_exist
     @safeguard_check()
@@ -143,14 +159,13 @@ class AgentInstaller(AgentGenerator):
         """
         Perform a complete setup sequence:
         1. (Re-)Build the agent file
-        2. Register the agent
-        3. Enable it
-        4. Start it immediately
+        2. Register (bootstrap) the agent
+
+        Since the agent is generated with `RunAtLoad=True`, bootstrapping it
+        also starts it, so no separate `enable`/`start` calls are issued.
         """
         self.build_agent()
         self.register_agent()
-        self.enable_agent()
-        self.start_agent()
 
     @agent_must_exist
     def full_uninstall(self):
@@ -177,19 +192,35 @@ class AgentInstaller(AgentGenerator):
     def guid(self):
         return f"gui/{getuid()}"
 
-    @property
+    @cached_property
     def launchctl_bin(self):
         """
         Path: Absolute path to the `launchctl` binary on the system.
+
+        `launchctl` ships at a fixed location on macOS, so `$PATH` is only
+        searched when it is missing from there.
         """
+        if is_file(LAUNCHCTL_PATH):
+            return LAUNCHCTL_PATH
         return find_package("launchctl")
 
-    @property
+    @cached_property
     def is_booted_already(self):
-        list_process = self.execute_launchctl(["list"])
-        agents = list_process.stdout.split("\t")
-        agent_found = next((i for i in agents if i.startswith(self.AGENT_LABEL)), False)
-        return bool(agent_found)
+        """
+        bool: Whether the agent is currently loaded in the user's GUI domain.
+
+        `launchctl print` exits with status 0 only when the service is loaded,
+        so no output parsing is required. The result is cached until the agent
+        is bootstrapped or booted out (see `reset_booted_state`).
+        """
+        print_process = self.execute_launchctl(
+            ["print", f"{self.guid}/{self.AGENT_LABEL}"], check=False
+        )
+        return print_process.returncode == 0
+
+    def reset_booted_state(self):
+        """Discard the cached `is_booted_already` result."""
+        self.__dict__.pop("is_booted_already", None)
 
 
 def launch_agent(
@@ -215,7 +246,8 @@ def launch_agent(
         enable (bool): Enable the agent.
         disable (bool): Disable the agent.
         start_now (bool): Start the agent immediately.
-        full_install (bool): Perform full setup (register, enable, start).
+        full_install (bool): Perform full setup (build, register). The agent
+            starts on bootstrap because it is generated with `RunAtLoad=True`.
 
     Raises:
         ValueError: If conflicting flags are provided (e.g., enable+disable, register+deregister).
@@ -228,6 +260,9 @@ def launch_agent(
     # Perform full install if explicitly requested or all main flags are set
     if full_install or all((register, enable, start_now)):
         agent_installer.full_install()
+        # `full_install` no longer enables the agent; honor an explicit request.
+        if enable:
+            agent_installer.enable_agent()
     elif full_uninstall or all((deregister, disable)):
         agent_installer.full_uninstall()
     else:
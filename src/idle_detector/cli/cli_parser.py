@@ -62,7 +62,7 @@ async def cli_parser():
     lp_true("-e", "--enable", help="Enable the agent.")
     lp_true("-d", "--disable", help="Disable the agent.")
     lp_true("-s", "--start-now", help="Start the agent immediately.")
-    lp_true("-f", "--full-install", help="Full install: register, enable, start.")
+    lp_true("-f", "--full-install", help="Full install: build and register the agent.")
     lp_true("-F", "--full-uninstall", help="Full uninstall: deregister agent.")
     lp_true("-R", "--refresh-agent", help="Refresh (restart) the LaunchAgent.")
     lp_true("-C", "--check-agent", help="Check if LaunchAgent is running.")
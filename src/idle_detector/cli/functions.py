@@ -1,9 +1,10 @@
 import asyncio
 from argparse import ArgumentDefaultsHelpFormatter, RawTextHelpFormatter
-from functools import partial
+from functools import lru_cache, partial
 
 from ..models._dataclasses import SerializedNamespace
 from ..utils.common import PAUSE_DETECTION_TIMER
+from ..utils.metadata import __author__, __url__, __version__
 from ..utils.os_modules import terminate
 
 
@@ -30,13 +31,8 @@ def has_flag(parsed_arg, attr):
     return getattr(parsed_arg, attr, None)
 
 
+@lru_cache(maxsize=1)
 def get_metadata():
-    from ..utils.metadata import (
-        __author__,
-        __url__,
-        __version__,
-    )
-
     return SerializedNamespace(
         module="Metadata", author=__author__, url=__url__, version=__version__
     )
@@ -1,4 +1,5 @@
 import asyncio
+import logging
 import signal
 from contextlib import asynccontextmanager
 from dataclasses import dataclass, field
@@ -7,7 +8,14 @@ from typing import Any, Callable, ClassVar, Optional
 from .idle_notifier import idleNotifier
 from .agent import AgentInstaller, launch_agent
 from .models import idleStages, MacOS, Serializable, StageManager, TerminalNotifier
-from .utils.common import IDLE_DETECTOR_RUN, PAUSE_DETECTION_TIMER
+from .utils.common import (
+    MAX_PAUSE_DETECTION_TIMER,
+    PAUSE_BACKOFF_FACTOR,
+    PAUSE_BACKOFF_THRESHOLD,
+    PAUSE_DETECTION_TIMER,
+)
+
+logger = logging.getLogger(__name__)
 
 
 @dataclass(
@@ -35,6 +43,8 @@ class idleDetector(AgentInstaller, Serializable):
     idle_interval_if_no_modes_are_set: Optional[int | float] = field(default=None)
     consider_screensaver_as_off: Optional[bool] = field(default=False)
     group_notifications: Optional[bool] = field(default=False)
+    sleep_time_interval: Optional[int | float] = field(default=PAUSE_DETECTION_TIMER)
+    max_sleep_interval: Optional[int | float] = field(default=MAX_PAUSE_DETECTION_TIMER)
 
     # NOTE: May cause performance issues on some machines.
     detect_screensaver_status: Optional[bool] = field(default=False)
@@ -45,6 +55,10 @@ class idleDetector(AgentInstaller, Serializable):
         super(idleDetector, self).__init__()
 
         self.__lock = None
+        self.__shutdown_event = None
+        self.__last_stage = None
+        self.__unchanged_iterations = 0
+        self.__current_interval = self.sleep_time_interval
         self.__stage_manager = None
         self.__terminal_notifier = None
         self.__idle_notifier = None
@@ -69,13 +83,63 @@ class idleDetector(AgentInstaller, Serializable):
 
     async def initialize_run(self):
         """
-        Initialize global run state for the idle detection loop.
+        Initialize the run state for the idle detection loop.
+
+        Ensures the shutdown event that governs whether the main loop continues
+        executing exists, along with the signal handlers that set it.
+        This is invoked once at startup.
+        """
+        await self.setup_signal_handlers()
+
+    async def wait_for_shutdown(self, timeout: float) -> bool:
+        """
+        Park until a shutdown is requested or `timeout` seconds have elapsed.
+
+        Unlike `asyncio.sleep`, a shutdown signal wakes the waiter immediately.
+        A non-positive timeout still yields to the scheduler once, so a zero
+        `sleep_time_interval` cannot starve signal handlers or other tasks.
+
+        Returns:
+            bool: True if a shutdown was requested, False on timeout.
+        """
+        if timeout <= 0:
+            await asyncio.sleep(0)
+            return self.__shutdown_event.is_set()
+
+        try:
+            await asyncio.wait_for(self.__shutdown_event.wait(), timeout=timeout)
+        except asyncio.TimeoutError:
+            pass
+        return self.__shutdown_event.is_set()
+
+    def next_sleep_interval(
+        self, idle_stage: idleStages, activity_resumed: bool = False
+    ) -> float:
+        """
+        Compute the pause before the next detection iteration.
 
-        Sets the internal control flag that governs whether the main loop
-        continues executing. This is invoked once at startup.
+        Any stage transition, or user activity observed since the previous poll,
+        resets the interval to `sleep_time_interval`.
+        While the stage stays unchanged for `PAUSE_BACKOFF_THRESHOLD` iterations,
+        or once past the screensaver (where further transitions are minutes away),
+        the interval grows by `PAUSE_BACKOFF_FACTOR` up to `max_sleep_interval`.
         """
-        global IDLE_DETECTOR_RUN
-        IDLE_DETECTOR_RUN = True
+        if activity_resumed or idle_stage != self.__last_stage:
+            self.__last_stage = idle_stage
+            self.__unchanged_iterations = 0
+            self.__current_interval = self.sleep_time_interval
+            return self.__current_interval
+
+        self.__unchanged_iterations += 1
+        past_screensaver = (
+            not idle_stage.is_non_idle_stage() and idle_stage >= idleStages.SCREENSAVER
+        )
+        if past_screensaver or self.__unchanged_iterations >= PAUSE_BACKOFF_THRESHOLD:
+            self.__current_interval = min(
+                self.__current_interval * PAUSE_BACKOFF_FACTOR,
+                self.max_sleep_interval,
+            )
+        return self.__current_interval
 
     async def initiate_lock(self):
         if self.__lock is None:
@@ -94,7 +158,8 @@ class idleDetector(AgentInstaller, Serializable):
             await terminal_notifier.check_notifier()
 
         if self.__idle_notifier is None:
-            self.__idle_notifier = idleNotifier(self)
+            self.__idle_notifier = idle_notifier = idleNotifier(self)
+            idle_notifier.build_payload_cache()
 
         if self.__stages_notifier is None:
             self.__stages_notifier = idleStages.notifier_stages()
@@ -121,22 +186,24 @@ class idleDetector(AgentInstaller, Serializable):
         """
         Initialize signal handlers for process termination and interruption.
 
-        This method ensures signal handlers are registered only once per process
-        to prevent redundant or conflicting registrations.
+        The shutdown event is created lazily here (rather than in `__post_init__`)
+        because it must belong to the running event loop. Handlers are registered
+        together with it, so repeated calls neither re-register nor replace it.
+        Each signal simply sets the event; the main loop exits at its next wait.
         """
-        if not self.__lock:
-            await self.assign_signal_handler(self.shutdown_idle_detection)
-            self.__lock = True
+        if self.__shutdown_event is None:
+            self.__shutdown_event = shutdown_event = asyncio.Event()
+            await self.assign_signal_handler(shutdown_event.set)
 
     def shutdown_idle_detection(self, *_, **__):
         """
         Gracefully terminate the idle detection loop.
 
-        This method clears the global run flag used by the detection loop,
-        allowing any ongoing asynchronous iteration to complete before exiting.
+        This method sets the shutdown event used by the detection loop, waking
+        any pending wait so the current iteration completes and the loop exits.
         """
-        global IDLE_DETECTOR_RUN
-        IDLE_DETECTOR_RUN = False
+        if self.__shutdown_event is not None:
+            self.__shutdown_event.set()
 
     async def start_idle_detection(self):
         """
@@ -188,22 +255,25 @@ class idleDetector(AgentInstaller, Serializable):
         """
 
         # Initialize core components responsible for controlling runtime state.
-        # This ensures global flags, and signal handlers, are ready before entering the loop.
-        # NOTE: These operations are asynchronous and may involve I/O or system calls
-        # and must complete before the main loop begins.
-        await asyncio.gather(
-            self.initialize_run(),
-            self.setup_signal_handlers(),
-            self.initiate_lock(),
-            self.initialize_stage_manager(),
-        )
+        # This ensures the shutdown event, signal handlers and notifiers are ready
+        # before the loop, so the terminal-notifier probe runs once at startup.
+        # NOTE: These must complete before the main loop begins. They are awaited
+        # in sequence; only the notifier probe does any I/O, so scheduling them
+        # as concurrent tasks would cost more than it saves.
+        await self.initialize_run()
+        await self.initiate_lock()
+        await self.initialize_stage_manager()
+        await self.initialize_notifiers()
 
         # Begin the main idle detection loop.
-        # This loop runs indefinitely until the global flag is toggled off by a shutdown signal.
-        while IDLE_DETECTOR_RUN:
+        # This loop runs indefinitely until the shutdown event is set by a shutdown signal.
+        # Between iterations the task parks on the event, so a signal wakes it immediately.
+        # The pause adapts to activity: it backs off while the stage is stable
+        # and resets to `sleep_time_interval` on every stage transition or whenever
+        # the idle time drops (activity between two polls).
+        sleep_interval = self.sleep_time_interval
+        while not await self.wait_for_shutdown(sleep_interval):
             async with self.lock():
-                await asyncio.sleep(PAUSE_DETECTION_TIMER)
-
                 stage_manager = self.__stage_manager
 
                 # Evaluate the current system state and determine which idle stage applies.
@@ -224,19 +294,35 @@ class idleDetector(AgentInstaller, Serializable):
                 # compatible defined in `idleStages.stages_compatible_for_alerts()`.
                 idle_stage = stage_manager.idle_stage
 
+                # Per-poll trace; arguments are only formatted when DEBUG is enabled.
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug(
+                        "stage=%s seconds=%s display_was_off=%s",
+                        idle_stage,
+                        stage_manager.idle_seconds,
+                        stage_manager.display_was_off,
+                    )
+
                 if idle_stage.is_alert_stage():
                     # If the stage is alert-worthy, proceed to notify.
                     await self.start_terminal_notifier()
-                    await asyncio.sleep(PAUSE_DETECTION_TIMER)
+                    await self.wait_for_shutdown(PAUSE_DETECTION_TIMER)
 
                 if idle_stage.is_non_idle_stage():
-                    if self.__stages_notifier is not None:
-                        self.__stages_notifier.reset_attributes()
-                    await asyncio.sleep(3)
+                    self.__stages_notifier.reset_attributes()
+                    await self.wait_for_shutdown(3)
+                elif stage_manager.activity_resumed:
+                    # The user was active between two polls but is idle again;
+                    # re-arm the alerts so the next idle cycle is not suppressed.
+                    self.__stages_notifier.reset_attributes()
+
+                sleep_interval = self.next_sleep_interval(
+                    idle_stage, stage_manager.activity_resumed
+                )
 
     async def start_terminal_notifier(self):
-        await self.initialize_notifiers()
-
+        # NOTE: The notifiers are initialized once in `start_idle_detection`,
+        # keeping the terminal-notifier probe off the alert path.
         idle_notifier = self.__idle_notifier
         idle_stage = self.__stage_manager.idle_stage
         stage_notifier = self.__stages_notifier
@@ -244,6 +330,7 @@ class idleDetector(AgentInstaller, Serializable):
         if not stage_notifier.stage_was_notified(idle_stage):
             await idle_notifier.send_alert()
             stage_notifier.toggle_notified_status(idle_stage)
+            logger.info("Sent idle alert for stage %s", idle_stage)
             await asyncio.sleep(PAUSE_DETECTION_TIMER)
 
     @property
@@ -1,61 +1,92 @@
 import asyncio
 from functools import partial
-from operator import sub
+from operator import attrgetter
 from typing import Optional
 
-from .models import (
-    idleSeconds,
-    idleStages,
-)
-from .utils.common import reverse_sort
+from .models import idleSeconds, idleStages
+
+# Which pair of reference timers to diff, keyed by which of
+# (display_off_time, screensaver_time, reference_interval) are set.
+# Combinations without an entry have no meaningful delta.
+_DISPLAY_OFF_AND_SCREENSAVER = attrgetter("display_off_time", "screensaver_time")
+_DELTA_TIMERS = {
+    (True, True, False): _DISPLAY_OFF_AND_SCREENSAVER,
+    (True, True, True): _DISPLAY_OFF_AND_SCREENSAVER,
+    (True, False, True): attrgetter("reference_interval", "display_off_time"),
+    (False, True, True): attrgetter("reference_interval", "screensaver_time"),
+}
+
+
+def _format_human(seconds, compact) -> str:
+    # Formatting is memoized once in `time_handler`; this only normalizes the
+    # raw (possibly fractional) seconds and the compact flag for it.
+    return idleSeconds(int(seconds)).human_readable(compact_name=bool(compact))
 
 
 class idleNotifier:
+    __slots__ = (
+        "_idle_detector",
+        "_stage_message_dispatch",
+        "_payload_cache",
+        "__weakref__",
+    )
+
     def __init__(self, idle_detector):
         self._idle_detector = idle_detector
 
+        # Stage -> message builder jump table used by `build_notification_message`.
+        # Stages without an entry fall back to `_msg_fallback`.
+        self._stage_message_dispatch = {
+            idleStages.HALFWAY_TO_SCREENSAVER: self._msg_pre_screensaver,
+            idleStages.THREE_QUARTERS_TO_SCREENSAVER: self._msg_pre_screensaver,
+            idleStages.SCREENSAVER: self._msg_screensaver,
+            idleStages.DISPLAY_OFF_WARNING: self._msg_display_off,
+            idleStages.WAKE_UP: self._msg_wake_up,
+        }
+
+        # Per-stage notifier payload skeletons; see `build_payload_cache`.
+        self._payload_cache = {}
+
     def calculate_display_time_difference(self):
         idle_detector = self._idle_detector
         reference_timers = idle_detector.stage_manager.reference_timers
-        display_off_time = reference_timers.display_off_time
-        screensaver_time = reference_timers.screensaver_time
-        reference_interval = reference_timers.reference_interval
 
         # Determine which two timers are relevant for computing a delta.
         # The logic intentionally avoids explicit branching semantics; instead,
-        # it selects the first matching pair of configured timing modes, providing
+        # it looks up the matching pair of configured timing modes, providing
         # flexibility for systems that may expose partial idle-mode configurations.
-        if all(modes := (display_off_time, screensaver_time)):
-            pass
-        elif all(modes := (reference_interval, display_off_time)):
-            pass
-        elif all(modes := (reference_interval, screensaver_time)):
-            pass
-        else:
-            modes = None
+        select_timers = _DELTA_TIMERS.get(
+            (
+                bool(reference_timers.display_off_time),
+                bool(reference_timers.screensaver_time),
+                bool(reference_timers.reference_interval),
+            )
+        )
+        modes = select_timers(reference_timers) if select_timers else None
 
         # If valid timing data exists, compute the temporal offset between the two.
         # The resulting difference is returned in a human-readable format suitable
         # for user-facing notifications or debug traces.
         if modes:
-            idle_seconds = idleSeconds(sub(*reverse_sort(modes)))
-            human_readable_duration = idle_seconds.human_readable(
-                idle_detector.compact_timestamp
+            first_time, second_time = modes
+            delta = (
+                first_time - second_time
+                if first_time > second_time
+                else second_time - first_time
             )
-            return human_readable_duration
+            return _format_human(delta, idle_detector.compact_timestamp)
 
     def create_idle_time_message(
         self, duration, compact_timestamp, message_only: bool = True
     ):
         # Create a concise descriptor for how long the system has been idle.
         # Converts raw duration seconds into a normalized, human-readable value.
-        seconds_duration = idleSeconds(duration)
-        hr_format = seconds_duration.human_readable(compact_name=compact_timestamp)
+        hr_format = _format_human(duration, compact_timestamp)
         msg = f"Machine been idle for {hr_format}."
 
         if message_only:
             return msg
-        return seconds_duration.seconds, msg
+        return duration, msg
 
     def create_message_template(
         self,
@@ -75,26 +106,28 @@ class idleNotifier:
         elif sleep_time:
             msg = f"Display will fully turn off in {duration}"
         else:
-            msg = ""
+            # Nothing to append; avoid the replace/concat below.
+            return prefix
 
         # Streamline message when the duration is immediate.
         # This removes redundant linguistic fillers (e.g., "in soon").
         if duration == "soon":
             msg = msg.replace("in ", "", 1) + "."
 
-        return "{}{}{}".format(prefix, " " if prefix else "", msg)
+        return f"{prefix} {msg}" if prefix else msg
 
     def build_notification_message(self):
-        stage_manager = self._idle_detector.stage_manager
+        # Bind every attribute chain once; this runs for each alert sent.
+        idle_detector = self._idle_detector
+        stage_manager = idle_detector.stage_manager
         idle_stage = stage_manager.idle_stage
-        idle_seconds = stage_manager.idle_seconds
-        seconds = idle_seconds.seconds
-        compact_timestamp: bool = self._idle_detector.compact_timestamp
+        seconds = stage_manager.idle_seconds.seconds
+        compact_timestamp: bool = idle_detector.compact_timestamp
 
         reference_timers = stage_manager.reference_timers
         reference_time = (
             reference_timers.display_off_time
-            if idle_stage in idleStages.display_off_only_stages()
+            if idle_stage.is_display_off_stage()
             else reference_timers.screensaver_time
         )
 
@@ -102,9 +135,8 @@ class idleNotifier:
         # This enables proactive notifications (e.g., before display off or sleep).
         if reference_time:
             next_stage_duration_remaining = reference_time - seconds
-            idle_seconds_time_left = idleSeconds(next_stage_duration_remaining)
-            time_left_until_next_display_stage = idle_seconds_time_left.human_readable(
-                compact_name=compact_timestamp
+            time_left_until_next_display_stage = _format_human(
+                next_stage_duration_remaining, compact_timestamp
             )
         else:
             time_left_until_next_display_stage = None
@@ -112,55 +144,54 @@ class idleNotifier:
         prefix = self.create_idle_time_message(seconds, compact_timestamp)
 
         # Dynamically format the outgoing message template based on the current stage.
-        # Each branch corresponds to a specific user-facing idle milestone.
-        match idle_stage:
-            case idleStages.HALFWAY_TO_SCREENSAVER:
-                return self.create_message_template(
-                    prefix,
-                    time_left_until_next_display_stage,
-                    pre_screensaver_stage=True,
-                )
-            case idleStages.THREE_QUARTERS_TO_SCREENSAVER:
-                return self.create_message_template(
-                    prefix,
-                    time_left_until_next_display_stage,
-                    pre_screensaver_stage=True,
-                )
-            case idleStages.SCREENSAVER:
-                next_stage_duration = self.calculate_display_time_difference()
-
-                if next_stage_duration is not None:
-                    time_left_until_next_display_stage = next_stage_duration
-
-                return self.create_message_template(
-                    "Snooze time 💤.",
-                    time_left_until_next_display_stage,
-                    sleep_time=True,
-                )
-            case idleStages.DISPLAY_OFF_WARNING:
-                return self.create_message_template(
-                    "Sleep time 💤.", None, sleep_time=True
-                )
-            case idleStages.WAKE_UP:
-                total_seconds_before_waking_up = (
-                    stage_manager.total_seconds_before_waking_up
-                )
-                seconds, prefix = self.create_idle_time_message(
-                    total_seconds_before_waking_up,
-                    compact_timestamp,
-                    message_only=False,
-                )
-                return f"{prefix}\nTotal Seconds: {int(seconds):,}"
-            case _:
-                # Fallback: minimal descriptor (no contextual expansion).
-                return prefix
+        # Each handler corresponds to a specific user-facing idle milestone.
+        handler = self._stage_message_dispatch.get(idle_stage, self._msg_fallback)
+        return handler(prefix, time_left_until_next_display_stage)
+
+    def _msg_pre_screensaver(self, prefix, time_left_until_next_display_stage):
+        return self.create_message_template(
+            prefix,
+            time_left_until_next_display_stage,
+            pre_screensaver_stage=True,
+        )
 
-    async def send_alert(self):
+    def _msg_screensaver(self, prefix, time_left_until_next_display_stage):
+        next_stage_duration = self.calculate_display_time_difference()
+
+        if next_stage_duration is not None:
+            time_left_until_next_display_stage = next_stage_duration
+
+        return self.create_message_template(
+            "Snooze time 💤.",
+            time_left_until_next_display_stage,
+            sleep_time=True,
+        )
+
+    def _msg_display_off(self, prefix, time_left_until_next_display_stage):
+        return self.create_message_template("Sleep time 💤.", None, sleep_time=True)
+
+    def _msg_wake_up(self, prefix, time_left_until_next_display_stage):
         idle_detector = self._idle_detector
-        idle_stage = idle_detector.stage_manager.idle_stage
-        terminal_notifier = idle_detector.terminal_notifier
-        content_images = terminal_notifier.content_images
-        message = self.build_notification_message()
+        seconds, prefix = self.create_idle_time_message(
+            idle_detector.stage_manager.total_seconds_before_waking_up,
+            idle_detector.compact_timestamp,
+            message_only=False,
+        )
+        return f"{prefix}\nTotal Seconds: {int(seconds):,}"
+
+    def _msg_fallback(self, prefix, time_left_until_next_display_stage):
+        # Fallback: minimal descriptor (no contextual expansion).
+        return prefix
+
+    def build_payload_cache(self):
+        """
+        Precompute the terminal-notifier payload for every alert-worthy stage.
+
+        Everything except the message depends only on the stage and on the
+        detector's configuration, so `send_alert` merely adds the message.
+        """
+        idle_detector = self._idle_detector
+        content_images = idle_detector.terminal_notifier.content_images
 
         # --- Notification grouping semantics ---
         # The 'group' key in the terminal-notifier payload must be **omitted entirely**
@@ -174,21 +205,33 @@ class idleNotifier:
         #
         # This subtle behavior prevents "phantom grouping" side effects that occur when
         # notifications share an unset but internally normalized group identifier.
-        group_type_id = idle_stage.stage_group_id()
-        group = {"group": group_type_id} if idle_detector.group_notifications else {}
+        group_notifications = idle_detector.group_notifications
+        ignore_dnd = idle_detector.ignoreDnD
+        payload_cache = self._payload_cache
 
         # Compose the notifier payload. Each argument corresponds to a display
         # attribute within the terminal-notifier integration. The mapping uses
         # symbolic accessors (content_images, ignoreDnD) to remain adaptable
         # across desktop environments.
-        kwarg_cmd = dict(
-            title="IDLE-DETECTION",
-            subtitle=idle_stage.stage_name(),
-            message=message,
-            ignoreDnD=idle_detector.ignoreDnD,
-            contentImage=group_type_id.content_image_by_group(content_images),
-            **group,
-        )
+        for idle_stage in idleStages.stages_compatible_for_alerts():
+            group_type_id = idle_stage.stage_group_id()
+            group = {"group": group_type_id} if group_notifications else {}
+            payload_cache[idle_stage] = dict(
+                title="IDLE-DETECTION",
+                subtitle=idle_stage.stage_name(),
+                ignoreDnD=ignore_dnd,
+                contentImage=group_type_id.content_image_by_group(content_images),
+                **group,
+            )
+
+    async def send_alert(self):
+        idle_detector = self._idle_detector
+        idle_stage = idle_detector.stage_manager.idle_stage
+        terminal_notifier = idle_detector.terminal_notifier
+        payload = {
+            **self._payload_cache[idle_stage],
+            "message": self.build_notification_message(),
+        }
 
         # Delegate final notification dispatch asynchronously to the terminal notifier.
-        await terminal_notifier.notify(**kwarg_cmd)
+        await terminal_notifier.notify(**payload)
@@ -1,45 +1,165 @@
+import atexit
+import io
 import logging
-from logging.handlers import RotatingFileHandler
-from pathlib import Path
+import os
+import queue
+import threading
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
 
 from ..models.machine import MacOS
 from ..utils.common import PathLike
-from ..utils.os_modules import rename, rm_file
+from ..utils.os_modules import is_regular_fd, replace, truncate
 
 Logger = logging.Logger
 
+# Size (in bytes) of the in-memory write buffer used by `RotateLogHandler`.
+# Records are batched until the buffer fills instead of issuing one `write()` per record.
+LOG_BUFFER_SIZE = 65_536  # 64 KB
+
+# Interval (in seconds) at which buffered log records are flushed to disk.
+LOG_FLUSH_INTERVAL = 30
+
+# Default log file, resolved (and the host machine validated) on first use.
+_DEFAULT_LOG_FILE = None
+
+# `(stream_only, include_timestamp)` of the handlers installed by `get_logger`.
+_LOGGER_CONFIG = None
+
+# Shared formatters keyed by `include_timestamp`, and the shared console handler.
+_FORMATTERS = {
+    include_timestamp: logging.Formatter(
+        fmt="{}%(message)s".format("[%(asctime)s]--" if include_timestamp else ""),
+        datefmt="%Y-%m-%dT%I:%M:%S%p",
+    )
+    for include_timestamp in (True, False)
+}
+_STREAM_HANDLER = logging.StreamHandler()
+
+
+def _split_rotated_name(basename: str):
+    """
+    Split a file name such as "idleDetector.log.1" into ("idleDetector", "log", "1").
+    Returns None when the name does not end in a numeric rotation index.
+    """
+    name_parts = basename.rsplit(".", 2)
+    if len(name_parts) == 3 and name_parts[-1].isdigit():
+        return name_parts
+
 
 class RotateLogHandler(RotatingFileHandler):
-    """Custom rotating log handler with controlled suffix logic."""
+    """
+    Custom rotating log handler with controlled suffix logic.
 
-    def rotation_filename(self, default_name: PathLike):
+    Records are written into a 64 KB buffer rather than flushed one by one.
+    The buffer is flushed periodically (every `LOG_FLUSH_INTERVAL` seconds),
+    whenever it fills up, and immediately for records at `WARNING` or above.
+    """
+
+    def __init__(self, *args, **kwargs):
+        # Size of the active log file, tracked in-process so rollover checks
+        # need neither a `tell()` nor a second `format()` per record.
+        self._bytes_written = 0
+        # Whether the log file is a regular file, cached at `_open()` time.
+        # Non-regular targets (e.g. /dev/null) are never rolled over.
+        self._is_regular_file = True
+        super().__init__(*args, **kwargs)
+        self._flush_timer = None
+
+        # Rotated filenames never change for the lifetime of the handler,
+        # so resolve them once: index 0 → `.1.log`, index N-1 → `.N.log`.
+        base_filename = os.path.splitext(self.baseFilename)[0]
+        self._rotated_filenames = rotated_filenames = tuple(
+            self.rotation_filename(f"{base_filename}.{i}.log")
+            for i in range(1, self.backupCount + 1)
+        )
+        # (source, destination) shifts applied on rollover, newest-last first:
+        # `.N-1.log` → `.N.log`, ..., `.1.log` → `.2.log`.
+        self._rotation_shifts = tuple(
+            zip(rotated_filenames[-2::-1], rotated_filenames[:0:-1], strict=True)
+        )
+        self.schedule_flush()
+
+    def _open(self):
+        """Open the log file as a buffered binary stream."""
+        raw_stream = io.FileIO(self.baseFilename, "a")
+        # Append mode positions the raw stream at the end of any existing content.
+        self._bytes_written = raw_stream.tell()
+        self._is_regular_file = is_regular_fd(raw_stream.fileno())
+        return io.BufferedWriter(raw_stream, buffer_size=LOG_BUFFER_SIZE)
+
+    def shouldRollover(self, record, pending_bytes: int = 0):
         """
-        Returns the proper rotated filename for a given log file path.
-        Ensures numeric suffix ordering and consistent `.log` extension.
+        Roll over once writing `pending_bytes` would reach `maxBytes`.
+        Unlike the base class, this never stats, seeks or formats per record;
+        the size is tracked in-process and the regular-file guard uses the
+        result cached when the stream was opened.
         """
+        return (
+            self._is_regular_file
+            and 0 < self.maxBytes <= self._bytes_written + pending_bytes
+        )
+
+    def emit(self, record):
+        """
+        Write the encoded record straight into the buffered stream.
+        Skips `StreamHandler`'s per-record flush; only urgent records are flushed.
+        """
+        try:
+            # Format once; the encoded size also drives the rollover check.
+            msg = self.format(record) + self.terminator
+            data = msg.encode(self.encoding or "utf-8")
+
+            # An empty file is never rolled over, even for an oversized record.
+            if self._bytes_written and self.shouldRollover(record, len(data)):
+                self.doRollover()
 
-        def clean_suffix(suffix):
-            return suffix.removeprefix(".")
+            if self.stream is None:
+                self.stream = self._open()
 
-        def is_default_file(suffixes):
-            return suffixes[0] == "log" and len(suffixes) == 1
+            self.stream.write(data)
+            self._bytes_written += len(data)
 
-        def is_invalid_file_type(suffixes):
-            possible_digit = suffixes[-1]
-            return possible_digit.isnumeric()
+            if record.levelno >= logging.WARNING:
+                self.stream.flush()
+        except RecursionError:
+            raise
+        except Exception:
+            self.handleError(record)
 
-        default_name = Path(default_name)
-        suffixes = list(map(clean_suffix, default_name.suffixes))
+    def schedule_flush(self):
+        """Arm a background timer that periodically flushes the buffered stream."""
+        self._flush_timer = timer = threading.Timer(
+            LOG_FLUSH_INTERVAL, self.periodic_flush
+        )
+        timer.daemon = True
+        timer.start()
 
-        if not is_invalid_file_type(suffixes) or (
-            not suffixes or is_default_file(suffixes)
-        ):
-            current_log_file = default_name
-        else:
-            suffixes = ".".join(suffixes[::-1])
-            current_log_file = default_name.with_suffix(f".{suffixes}")
+    def periodic_flush(self):
+        self.flush()
+        if self._flush_timer is not None:
+            self.schedule_flush()
 
-        return current_log_file
+    def close(self):
+        if self._flush_timer is not None:
+            self._flush_timer.cancel()
+            self._flush_timer = None
+        super().close()
+
+    def rotation_filename(self, default_name: PathLike):
+        """
+        Returns the proper rotated filename (as a string) for a given log file path.
+        Ensures numeric suffix ordering and consistent `.log` extension.
+        """
+
+        default_name = os.fspath(default_name)
+        directory, sep, basename = default_name.rpartition(os.sep)
+
+        if (name_parts := _split_rotated_name(basename)) is None:
+            return default_name
+
+        # "<stem>.<ext>.<n>" → "<stem>.<n>.<ext>"
+        stem, ext, index = name_parts
+        return f"{directory}{sep}{stem}.{index}.{ext}"
 
     def doRollover(self):
         """
@@ -49,58 +169,96 @@ class RotateLogHandler(RotatingFileHandler):
 
         # Copied and modified code from `RotatingFileHandler.doRollover`
         if self.stream:
+            # Flush first so buffered records are not lost during rotation.
+            self.stream.flush()
             self.stream.close()
             self.stream = None
 
         if self.backupCount > 0:
-            base_filename = Path(self.baseFilename)
+            rotated_filenames = self._rotated_filenames
+
+            # Set the oldest backup aside instead of discarding it; its file is
+            # truncated and reused as the new active log (no unlink + create).
+            recycled_filename = f"{self.baseFilename}.tmp"
+            try:
+                replace(rotated_filenames[-1], recycled_filename)
+            except FileNotFoundError:
+                recycled_filename = None
 
-            for i in range(self.backupCount - 1, 0, -1):
-                sfn = self.rotation_filename(base_filename.with_suffix(f".{i}.log"))
-                dfn = self.rotation_filename(base_filename.with_suffix(f".{i + 1}.log"))
+            # `os.replace` atomically overwrites the destination, so neither an
+            # existence check nor a separate unlink is needed per backup slot.
+            for sfn, dfn in self._rotation_shifts:
+                try:
+                    replace(sfn, dfn)
+                except FileNotFoundError:
+                    continue
 
-                if sfn.exists():
-                    rm_file(dfn)
-                    rename(sfn, dfn)
+            self.rotate(self.baseFilename, rotated_filenames[0])
 
-            dfn = self.rotation_filename(base_filename.with_suffix(".1.log"))
-            rm_file(dfn)
+            if recycled_filename is not None:
+                replace(recycled_filename, self.baseFilename)
+                truncate(self.baseFilename)
 
-            self.rotate(self.baseFilename, dfn)
+        self._bytes_written = 0
 
         if not self.delay:
             self.stream = self._open()
 
 
+async def get_default_log_file():
+    """
+    Validate the host machine and resolve the default log file path.
+    Both are fixed for the lifetime of the process, so this runs only once.
+    """
+    global _DEFAULT_LOG_FILE
+
+    if _DEFAULT_LOG_FILE is None:
+        mac_machine = MacOS()
+        await mac_machine.check_machine()
+        _DEFAULT_LOG_FILE = mac_machine.log_files().log_file
+    return _DEFAULT_LOG_FILE
+
+
 async def get_logger(stream_only: bool = False, include_timestamp: bool = True):
     """
     Returns a preconfigured logger for macOS environments.
     When stream_only=True: logs only to console
     When stream_only=False: logs to both console and file
+
+    Calling it again with the same arguments reuses the installed handlers.
     """
+    global _LOGGER_CONFIG
+
     root_logger = logging.getLogger()
+    logger_config = (stream_only, include_timestamp)
+
+    if _LOGGER_CONFIG == logger_config and root_logger.handlers:
+        return root_logger
 
     if root_logger.hasHandlers():
+        for handler in root_logger.handlers:
+            if (listener := getattr(handler, "listener", None)) is not None:
+                atexit.unregister(listener.stop)
+                listener.stop()
+                for listener_handler in listener.handlers:
+                    if listener_handler is not _STREAM_HANDLER:
+                        listener_handler.close()
         root_logger.handlers.clear()
 
     level = logging.INFO
 
-    fmt = "{}%(message)s".format("" if not include_timestamp else "[%(asctime)s]--")
-    formatter = logging.Formatter(
-        fmt=fmt,
-        datefmt="%Y-%m-%dT%I:%M:%S%p",
-    )
+    formatter = _FORMATTERS[bool(include_timestamp)]
 
-    stream_handler = logging.StreamHandler()
+    stream_handler = _STREAM_HANDLER
     stream_handler.setLevel(level)
     stream_handler.setFormatter(formatter)
-    root_logger.addHandler(stream_handler)
-
-    if not stream_only:
-        mac_machine = MacOS()
-        await mac_machine.check_machine()
 
-        default_log_file = mac_machine.log_files().log_file
+    if stream_only:
+        # CLI output stays synchronous: the CLI exits through `os._exit`, which
+        # would drop records still waiting on a listener thread.
+        root_logger.addHandler(stream_handler)
+    else:
+        default_log_file = await get_default_log_file()
         max_log_size = 10_000_000  # 10 MB
         max_log_files = 5
         file_handler = RotateLogHandler(
@@ -112,8 +270,20 @@ async def get_logger(stream_only: bool = False, include_timestamp: bool = True):
         )
         file_handler.setLevel(level)
         file_handler.setFormatter(formatter)
-        root_logger.addHandler(file_handler)
+
+        # Console and disk writes (and rollovers) happen on a background listener
+        # thread, so the event loop only pays the cost of an enqueue per record.
+        log_queue = queue.SimpleQueue()
+        queue_handler = QueueHandler(log_queue)
+        queue_handler.setLevel(level)
+        queue_handler.listener = listener = QueueListener(
+            log_queue, file_handler, stream_handler, respect_handler_level=True
+        )
+        listener.start()
+        atexit.register(listener.stop)
+        root_logger.addHandler(queue_handler)
 
     root_logger.setLevel(level)
+    _LOGGER_CONFIG = logger_config
 
     return root_logger
@@ -1,11 +1,10 @@
-from dataclasses import MISSING, asdict, is_dataclass
-from decimal import Decimal
+from dataclasses import MISSING, is_dataclass
 from enum import IntEnum, StrEnum, auto
-from functools import lru_cache, total_ordering
-from operator import add, mul, sub
+from functools import lru_cache
+from operator import attrgetter
 from types import SimpleNamespace
 
-from ..utils.common import NULL_INFINITY, reverse_sort, to_seconds, type_name
+from ..utils.common import NULL_INFINITY, to_seconds, type_name
 
 
 class Serializable:
@@ -17,16 +16,44 @@ class Serializable:
 
     is_dataclass = staticmethod(is_dataclass)
 
+    @classmethod
+    @lru_cache
+    def _field_names(cls):
+        """
+        Dataclass field names, resolved once per class (`None` for non-dataclasses).
+        Resolved lazily: `__init_subclass__` runs before `@dataclass` decorates.
+        """
+        fields = getattr(cls, "__dataclass_fields__", None)
+        return None if fields is None else tuple(fields)
+
+    @classmethod
+    @lru_cache
+    def _reset_plan(cls):
+        """
+        `(name, default, default_factory)` for each resettable dataclass field,
+        resolved once per class. Fields without any default are skipped.
+        """
+        plan = []
+        for name, field_attr in cls.__dataclass_fields__.items():
+            attr_default = field_attr.default
+            attr_dfactory = field_attr.default_factory
+
+            if attr_dfactory is not MISSING:
+                plan.append((name, None, attr_dfactory))
+            elif attr_default is not MISSING:
+                plan.append((name, attr_default, None))
+        return tuple(plan)
+
     def asdict(self):
         """
         Return a serializable dictionary representation of the instance.
 
-        - For dataclasses → uses `dataclasses.asdict`.
+        - For dataclasses → maps each field name to its current value.
         - For regular classes → returns a shallow copy of `__dict__`.
         """
-        if self.is_dataclass(self):
-            # For dataclasses, use the built-in asdict
-            return asdict(self)
+        if (field_names := self._field_names()) is not None:
+            # Shallow by design: `dataclasses.asdict` would deep-copy every field.
+            return {name: getattr(self, name) for name in field_names}
         # For regular classes, use instance __dict__ (only attributes set in __init__)
         return self.__dict__.copy()
 
@@ -39,7 +66,13 @@ class Serializable:
                              If False (default), checks if any are truthy.
         """
         method = all if all_args else any
-        return method(map(bool, self.asdict().values()))
+        # Feed values lazily so `any`/`all` can stop at the first decisive one,
+        # without materializing an `asdict()` copy just to test it.
+        if (field_names := self._field_names()) is not None:
+            values = (getattr(self, name) for name in field_names)
+        else:
+            values = self.__dict__.values()
+        return method(values)
 
     def reset_attributes(self):
         """
@@ -49,16 +82,8 @@ class Serializable:
         if not self.is_dataclass(self):
             return
 
-        for name, field_attr in self.__dataclass_fields__.items():
-            attr_default = field_attr.default
-            attr_dfactory = field_attr.default_factory
-
-            if attr_default is MISSING and attr_dfactory:
-                value = attr_dfactory()
-            elif attr_default and attr_dfactory is MISSING:
-                value = attr_default
-            else:
-                value = attr_default
+        for name, attr_default, attr_dfactory in self._reset_plan():
+            value = attr_default if attr_dfactory is None else attr_dfactory()
             setattr(self, name, value)
 
 
@@ -70,11 +95,27 @@ class SerializedNamespace(SimpleNamespace, Serializable):
     """
 
     def __init__(self, **kwargs):
+        # Insertion-ordered set of public attribute names, maintained on every
+        # set/delete so serialization never has to rescan `dir()`.
+        self.__public = {}
+
+        # `module` only names the namespace; drop it before storing the reset values.
+        # The fallback name is computed only when no `module` was given.
+        module = kwargs.pop("module", None)
+        self.__name__ = type_name(self) if module is None else module
         self.__kwargs = kwargs
-        self.__name__ = kwargs.pop("module", type_name(self))
         super().__init__(**kwargs)
+        self.__public.update(dict.fromkeys(k for k in kwargs if not k.startswith("_")))
+
+    def __setattr__(self, name, value):
+        super().__setattr__(name, value)
+        if not name.startswith("_"):
+            self.__public[name] = None
+
+    def __delattr__(self, name):
+        super().__delattr__(name)
+        self.__public.pop(name, None)
 
-    @property
     def __dir__(self):
         # Exclude __name__ from dir() listings
         return [k for k in super().__dir__() if not k.startswith("_")]
@@ -84,30 +125,43 @@ class SerializedNamespace(SimpleNamespace, Serializable):
 
     def __getstate__(self):
         # Only include public attributes for serialization
-        return {k: v for k, v in super().__dict__.items() if k in self.__dir__}
+        attrs = super().__dict__
+        return {k: attrs[k] for k in self.__public}
 
     def __repr__(self):
         # Filter out __name__ from the dict before printing
         items = ("{}={!r}".format(*kv) for kv in self.__getstate__().items())
         return f"{self.__name__}({', '.join(items)})"
 
-    def __getattribute__(self, name):
-        try:
-            return super().__getattribute__(name)
-        except AttributeError:
-            # Enables safe attribute access without exceptions
-            pass
+    def __getattr__(self, name):
+        # Only reached when normal lookup misses, so existing attributes pay no
+        # exception handling. Missing attributes read as None for safe access;
+        # dunder probes (e.g. copy/pickle protocols) still raise.
+        if name.startswith("__") and name.endswith("__"):
+            raise AttributeError(
+                f"{type_name(self)!r} object has no attribute {name!r}"
+            )
 
     # Dict-like interface for flexible attribute handling
     def __getitem__(self, name):
-        return self.__getattribute__(name)
+        return getattr(self, name)
 
     def __setitem__(self, key, value):
         setattr(self, key, value)
 
     def __delitem__(self, key):
-        if hasattr(self, key):
+        # A `hasattr` probe is always True here (see `__getattribute__`),
+        # so attempt the delete directly and ignore missing keys.
+        try:
             delattr(self, key)
+        except AttributeError:
+            pass
+
+    def has_arguments(self, all_args: bool = False):
+        # Public attributes only, read lazily (see `Serializable.has_arguments`).
+        method = all if all_args else any
+        attrs = super().__dict__
+        return method(attrs[k] for k in self.__public)
 
     def reset_attributes(self):
         for k, v in self.__kwargs.items():
@@ -115,7 +169,8 @@ class SerializedNamespace(SimpleNamespace, Serializable):
 
     # Convenience methods for attribute-style dictionary access
     def get(self, key, default=None):
-        return self.__getattribute__(key) or default
+        # Plain dict probe; falsy values (0, "", False) are returned as stored.
+        return self.__dict__.get(key, default)
 
     def keys(self):
         return self.__getstate__().keys()
@@ -210,11 +265,22 @@ class NotifierFlags(StrEnum):
 
     @classmethod
     def is_flag_available(cls, flag: str):
-        return flag.removeprefix("-") in cls
+        # Hashed membership test against the values collected below the class body.
+        return flag.removeprefix("-") in _NOTIFIER_FLAG_VALUES
 
     @property
     def flag(self):
-        return "-" + self.value
+        # Baked onto each member below the class body.
+        return self._flag
+
+
+# Every `NotifierFlags` value, for O(1) validation in `is_flag_available`.
+_NOTIFIER_FLAG_VALUES = frozenset(flag.value for flag in NotifierFlags)
+
+# Each member's command-line form (e.g. `-message`), built once.
+for _flag in NotifierFlags:
+    _flag._flag = "-" + _flag.value
+del _flag
 
 
 class TimeTypes(IntEnum):
@@ -264,22 +330,17 @@ class TimeTypes(IntEnum):
         return self.name.lower()[0]
 
     def format_time_value(self, value, compact_name: bool = False, title_case=False):
-        if not compact_name:
-            name = self.name
-            sep = " "
+        # Kept for compatibility; durations are rendered by `time_handler`.
+        if compact_name:
+            # Compact names have no plural form ("1s", not "1").
+            name, sep = self.compact_name(), ""
         else:
-            name = self.compact_name()
-            sep = ""
-
-        name = name.title() if title_case else name.lower()
-
-        if value == 1:
-            name = name.removesuffix("s")
-
-        return "{}{}{}".format(value, sep, name)
+            name, sep = self.name.lower(), " "
+            if value == 1:
+                name = name.removesuffix("s")
+        return f"{value}{sep}{name.title() if title_case else name}"
 
 
-@total_ordering
 class idleStages(StrEnum):
     """
     Enumeration representing the progressive stages of user inactivity and system idleness.
@@ -303,8 +364,9 @@ class idleStages(StrEnum):
         - StageLevels (IntEnum):
             Numeric representations (0–7) corresponding to each stage, enabling direct
             ordering and comparison of idle progression.
-        - StageNotified (dataclass):
-            Tracks notification status (True/False) for each idle stage (if-applicable).
+        - StageNotified:
+            Tracks notification status (True/False) for each idle stage (if-applicable)
+            as a bitmask indexed by stage level.
             Supports toggling and indexed access by stage enumeration.
 
     Comparison Behavior:
@@ -352,23 +414,31 @@ class idleStages(StrEnum):
         DISPLAY_OFF = auto()
         WAKE_UP = auto()
 
-    class StageNotified(SerializedNamespace):
+    class StageNotified:
         """Track notification status for each idle stage."""
 
+        # One bit per stage, indexed by its StageLevels value.
+        __slots__ = ("_mask",)
+
+        def __init__(self):
+            self._mask = 0
+
         def __getitem__(self, value: "idleStages"):
-            return getattr(self, value.value)
+            return self.get_stage(value)
 
         def get_stage(self, stage: "idleStages", *, override_self=None):
             self = override_self or self
-            return getattr(self, stage.value)
+            return bool(self._mask & (1 << stage._level))
 
         def toggle_notified_status(self, stage: "idleStages"):
-            current_value = self.get_stage(stage)
-            setattr(self, stage.value, not current_value)
-            return self.get_stage(stage, override_self=self)
+            self._mask ^= 1 << stage._level
+            return self.get_stage(stage)
 
         def stage_was_notified(self, stage: "idleStages"):
-            return self.get_stage(stage) is True
+            return self.get_stage(stage)
+
+        def reset_attributes(self):
+            self._mask = 0
 
         @staticmethod
         def compatible_stages(cls: "idleStages"):
@@ -380,19 +450,45 @@ class idleStages(StrEnum):
                 cls.WAKE_UP,
             ]
 
-    def __hash__(self):
-        return hash(str(self))
+    # Members hash like their string values, so value-keyed lookups still match.
+    __hash__ = str.__hash__
 
+    # Members are singletons, so equality is identity. Every ordering operator is
+    # defined explicitly (rather than via `total_ordering`) because `str` already
+    # provides them and would otherwise compare stage names instead of levels.
     def __eq__(self, value):
         if not isinstance(value, idleStages):
             return NotImplemented
-        return self.stage_level() == value.stage_level()
+        return self is value
+
+    def __ne__(self, value):
+        if not isinstance(value, idleStages):
+            return NotImplemented
+        return self is not value
 
     def __lt__(self, value):
         if not isinstance(value, idleStages):
             return NotImplemented
-        return self.stage_level() < value.stage_level()
+        return self._level < value._level
 
+    def __le__(self, value):
+        if not isinstance(value, idleStages):
+            return NotImplemented
+        return self._level <= value._level
+
+    def __gt__(self, value):
+        if not isinstance(value, idleStages):
+            return NotImplemented
+        return self._level > value._level
+
+    def __ge__(self, value):
+        if not isinstance(value, idleStages):
+            return NotImplemented
+        return self._level >= value._level
+
+    # Only a handful of stages and reference timers exist, and the same pairs are
+    # evaluated on every poll, so results are memoized per (stage, reference).
+    @lru_cache(maxsize=64)
     def threshold(self, reference_seconds):
         """
         Compute the threshold duration (in seconds) for the current idle stage based on a reference time.
@@ -416,45 +512,31 @@ class idleStages(StrEnum):
                 Typically derived from the system's configured screensaver or display-off delay.
 
         Returns:
-            Decimal: Calculated threshold in seconds for the current stage.
+            float: Calculated threshold in seconds for the current stage.
         """
-        seconds = to_seconds(reference_seconds) or NULL_INFINITY
+        # Plain float math: the thresholds are a few small constants, so there
+        # is nothing for `Decimal` precision to preserve.
+        seconds = float(to_seconds(reference_seconds) or NULL_INFINITY)
 
         match self:
             case idleStages.HALFWAY_TO_SCREENSAVER:
-                op_method = mul
-                threshold = 0.5
+                threshold = seconds * 0.5
             case idleStages.THREE_QUARTERS_TO_SCREENSAVER:
-                op_method = mul
-                threshold = 0.75
+                threshold = seconds * 0.75
             case idleStages.SCREENSAVER:
-                op_method = sub
-                threshold = 5
+                threshold = seconds - 5
             case idleStages.DISPLAY_OFF_WARNING:
-                op_method = sub
-                threshold = 15 if seconds <= TimeTypes.MINUTES else 45
+                threshold = seconds - (15 if seconds <= TimeTypes.MINUTES else 45)
             case _:
-                op_method = add
-                threshold = 0
+                threshold = seconds
 
-        op_args = reverse_sort([seconds, Decimal(threshold)])
-        return abs(op_method(*op_args)) if op_method else threshold
+        # Distance from the reference, regardless of which operand is larger.
+        return abs(threshold)
 
     def get_stage_type(self, group_ids: bool = False):
-        stages = self.stages_compatible_for_alerts()
-
-        if group_ids:
-            stage_values = (GroupTypes.IDLE, *GroupTypes)
-        else:
-            stage_values = (
-                "SleepTime Half-way Mark",
-                "SleepTime Third-way Mark",
-                "SleepTime Final Mark Reached",
-                "🚨 Display-Off Warning 🚨",
-                "Machine is Awake 🌞",
-            )
-        merged_values = zip(stages, stage_values, strict=True)
-        return next((v for s, v in merged_values if self is s), GroupTypes.IDLE)
+        # Mappings are built once below the class body.
+        stage_types = _STAGE_GROUP_IDS if group_ids else _STAGE_NAMES
+        return stage_types.get(self, GroupTypes.IDLE)
 
     def stage_name(self):
         """Human-readable stage name."""
@@ -465,79 +547,136 @@ class idleStages(StrEnum):
 
     def stage_level(self):
         """Numeric level indicating the order of stages."""
-        return self.StageLevels[self.name]
+        # Resolved once per member below the class body.
+        return self._level
 
     @classmethod
     def sort_stages(self, iterable_of_stages):
-        return sorted(iterable_of_stages, key=lambda s: s.stage_level())
+        return sorted(iterable_of_stages, key=_stage_level_key)
 
+    # NOTE: The `_is_*` flags are baked onto each member below the class body.
     def is_display_off_stage(self):
-        return self in self.display_off_only_stages()
+        return self._is_display_off
 
     def is_screensaver_stage(self):
-        return self in self.screensaver_mode_stages()
+        return self._is_screensaver
 
     def is_alert_stage(self):
-        return self in self.stages_compatible_for_alerts()
+        return self._is_alert
 
     def is_non_idle_stage(self):
-        return self in self.non_idle_stages()
+        return self._is_non_idle
 
     @classmethod
+    @lru_cache(maxsize=1)
     def stages_compatible_for_alerts(cls):
-        return cls.StageNotified.compatible_stages(cls)
+        return tuple(cls.StageNotified.compatible_stages(cls))
 
     @classmethod
     @lru_cache(maxsize=1)
     def notifier_stages(cls):
-        notifier_stages = cls.stages_compatible_for_alerts()
-        return cls.StageNotified(**{stage: False for stage in notifier_stages})
+        return cls.StageNotified()
+
+    # NOTE: The stage classifiers below always yield the same members, so each
+    # is computed once and returned as an (immutable) cached tuple.
 
     @classmethod
+    @lru_cache(maxsize=1)
     def non_idle_stages(cls):
         """
         Stages that do not indicate user idleness.
-        return [`USER_ACTIVE`, `WAKE_UP`]
+        return (`USER_ACTIVE`, `WAKE_UP`)
         """
-        return [cls.USER_ACTIVE, cls.WAKE_UP]
+        return (cls.USER_ACTIVE, cls.WAKE_UP)
 
     @classmethod
+    @lru_cache(maxsize=1)
     def idle_mode_stages(cls):
         """
         All stages except those that do not indicate user idleness.
-        return all stages except [`USER_ACTIVE`, `WAKE_UP`]
+        return all stages except (`USER_ACTIVE`, `WAKE_UP`)
         """
-        return cls.sort_stages([s for s in cls if s not in cls.non_idle_stages()])
+        non_idle_stages = cls.non_idle_stages()
+        return tuple(cls.sort_stages(s for s in cls if s not in non_idle_stages))
 
     @classmethod
+    @lru_cache(maxsize=1)
     def idle_only_stages(cls):
         """
         Stages that specifically indicate user idleness when
         the user's machine does not have display-off or screensaver modes configured.
-        return [`USER_ACTIVE`, `USER_IDLE`, `WAKE_UP`]
+        return (`USER_ACTIVE`, `USER_IDLE`, `WAKE_UP`)
         """
-        return cls.sort_stages([*cls.non_idle_stages(), cls.USER_IDLE])
+        return tuple(cls.sort_stages((*cls.non_idle_stages(), cls.USER_IDLE)))
 
     @classmethod
+    @lru_cache(maxsize=1)
     def screensaver_mode_stages(cls):
         """
         Stages relevant to screensaver mode, excluding display-off related stages.
-        return all stages except the last two stages [`DISPLAY_OFF_WARNING`, `DISPLAY_OFF`]
+        return all stages except the last two stages (`DISPLAY_OFF_WARNING`, `DISPLAY_OFF`)
         """
         return cls.idle_mode_stages()[:-2]
 
     @classmethod
+    @lru_cache(maxsize=1)
     def display_off_only_stages(cls):
-        return [cls.DISPLAY_OFF_WARNING, cls.DISPLAY_OFF]
+        return (cls.DISPLAY_OFF_WARNING, cls.DISPLAY_OFF)
 
     @classmethod
+    @lru_cache(maxsize=2)
     def display_off_stages(cls, consider_screensaver_as_off: bool = False):
         """
         Stages relevant to display-off mode, specifically the last two stages.
-        return [`DISPLAY_OFF`] only if `consider_screensaver_as_off` is not set.
-        Otherwise, return [`SCREENSAVER`, `DISPLAY_OFF_WARNING`, `DISPLAY_OFF`]
+        return (`DISPLAY_OFF_WARNING`, `DISPLAY_OFF`) if `consider_screensaver_as_off`
+        is not set. Otherwise, return (`SCREENSAVER`, `DISPLAY_OFF_WARNING`, `DISPLAY_OFF`)
         """
         display_off_stages = cls.display_off_only_stages()
         if consider_screensaver_as_off:
-            display_off_stages.append(idleStages.SCREENSAVER)
-        return cls.sort_stages(display_off_stages)
+            display_off_stages = (*display_off_stages, cls.SCREENSAVER)
+        return tuple(cls.sort_stages(display_off_stages))
+
+
+# Sort key for `idleStages.sort_stages`; reads the baked `_level` directly.
+_stage_level_key = attrgetter("_level")
+
+# Each member's `StageLevels` value as a plain int, used by ordering and comparisons.
+for _stage in idleStages:
+    _stage._level = idleStages.StageLevels[_stage.name].value
+
+# Display names and notification group ids of the alert-worthy stages.
+# Any other stage falls back to `GroupTypes.IDLE` (see `get_stage_type`).
+_STAGE_NAMES = dict(
+    zip(
+        idleStages.stages_compatible_for_alerts(),
+        (
+            "SleepTime Half-way Mark",
+            "SleepTime Third-way Mark",
+            "SleepTime Final Mark Reached",
+            "🚨 Display-Off Warning 🚨",
+            "Machine is Awake 🌞",
+        ),
+        strict=True,
+    )
+)
+_STAGE_GROUP_IDS = dict(
+    zip(
+        idleStages.stages_compatible_for_alerts(),
+        (GroupTypes.IDLE, *GroupTypes),
+        strict=True,
+    )
+)
+
+# Stage sets backing the `is_*_stage` checks. Membership is resolved once per
+# member here, so each per-poll check is a plain attribute read.
+_DISPLAY_OFF_ONLY_STAGES = frozenset(idleStages.display_off_only_stages())
+_SCREENSAVER_MODE_STAGES = frozenset(idleStages.screensaver_mode_stages())
+_ALERT_STAGES = frozenset(idleStages.stages_compatible_for_alerts())
+_NON_IDLE_STAGES = frozenset(idleStages.non_idle_stages())
+
+for _stage in idleStages:
+    _stage._is_display_off = _stage in _DISPLAY_OFF_ONLY_STAGES
+    _stage._is_screensaver = _stage in _SCREENSAVER_MODE_STAGES
+    _stage._is_alert = _stage in _ALERT_STAGES
+    _stage._is_non_idle = _stage in _NON_IDLE_STAGES
+del _stage
@@ -5,22 +5,34 @@ from decimal import Decimal
 from functools import cached_property, lru_cache
 from typing import ClassVar, Optional
 
+import objc
+from CoreFoundation import (
+    CFPreferencesCopyValue,
+    CFPreferencesSynchronize,
+    kCFPreferencesCurrentHost,
+    kCFPreferencesCurrentUser,
+)
+from Foundation import NSBundle
 from platformdirs.macos import MacOS as _MacOS
 from Quartz import (
     CGDisplayIsActive,
     CGEventSourceSecondsSinceLastEventType,
     CGMainDisplayID,
+    CGSessionCopyCurrentDictionary,
     kCGAnyInputEventType,
     kCGEventSourceStateCombinedSessionState,
 )
 
 from ..utils.common import (
+    MACHINE_SETTINGS_TTL,
+    PMSET_LOG_TTL,
     PROJECT,
+    async_ttl_cache,
     compare_versions,
     current_timestamp,
-    date_parser,
-    regex_findall,
+    regex_compiler,
     run_async_process,
+    run_async_process_text,
     run_in_thread,
     type_name,
     validate_interval_value,
@@ -34,32 +46,132 @@ from ..utils.os_modules import (
     get_mac_version,
     get_nodename,
     get_platform,
-    run_process,
 )
 from ._dataclasses import SerializedNamespace, TimeTypes
 from .time_handler import idleSeconds
 
+# Matches the `displaysleep <minutes>` row of `pmset -g` (raw bytes output).
+_DISPLAYSLEEP_RE = regex_compiler(rb"^\s*displaysleep\s+(\d+)")
+
+# Match display on/off notification rows of `pmset -g log`, keyed by "on"/"off".
+_DISPLAY_EVENT_RES = {
+    mode: regex_compiler(r".*Notification\s+Display is turned {}".format(mode))
+    for mode in ("on", "off")
+}
+
+# Preferences domain holding the screensaver settings.
+_SCREENSAVER_DOMAIN = "com.apple.screensaver"
+
+# Quartz symbols bound once at import for the idle and display polling paths.
+_CG_IDLE = CGEventSourceSecondsSinceLastEventType
+_SRC_STATE = kCGEventSourceStateCombinedSessionState
+_ANY_EVENT = kCGAnyInputEventType
+_CG_DISPLAY_IS_ACTIVE = CGDisplayIsActive
+_CG_MAIN_DISPLAY_ID = CGMainDisplayID
+
+
+def _session_screen_is_locked():
+    # The session dictionary is an in-process read of window server state.
+    session = CGSessionCopyCurrentDictionary() or {}
+    return bool(session.get("CGSSessionScreenIsLocked"))
+
+
+def _main_display_is_active():
+    # The main display id is resolved per call: it changes when displays are
+    # attached, detached or the lid is closed, so it is not safe to cache.
+    return _CG_DISPLAY_IS_ACTIVE(_CG_MAIN_DISPLAY_ID())
+
+
+# IOKit functions (name, PyObjC signature[, doc, metadata]) used to read
+# `HIDIdleTime` when Quartz reports no idle time. PyObjC ships no IOKit wrapper,
+# so they are loaded from the framework bundle on first use.
+#
+# Reference counts:
+# - `IOServiceMatching` returns a +1 dictionary, and `IOServiceGetMatchingService`
+#   consumes exactly one reference to it. PyObjC retains the returned proxy once
+#   more and releases that reference when the proxy is collected, so the pair is
+#   balanced as long as the dictionary is only ever passed to that one call.
+# - `IORegistryEntryCreateCFProperty` follows the Create rule; its +1 result is
+#   handed to PyObjC (`already_cfretained`) instead of being retained again.
+_IOKIT_FUNCTIONS = (
+    ("IOServiceMatching", b"@r*"),
+    ("IOServiceGetMatchingService", b"II@"),
+    (
+        "IORegistryEntryCreateCFProperty",
+        b"@I@@I",
+        "",
+        {"retval": {"already_cfretained": True}},
+    ),
+    ("IOObjectRelease", b"iI"),
+)
+
+# `kIOMainPortDefault` (formerly `kIOMasterPortDefault`).
+_IO_MAIN_PORT_DEFAULT = 0
+
+
+@lru_cache(maxsize=1)
+def _load_iokit():
+    iokit = {}
+    bundle = NSBundle.bundleWithIdentifier_("com.apple.framework.IOKit")
+    objc.loadBundleFunctions(bundle, iokit, _IOKIT_FUNCTIONS)
+    return iokit
+
+
+def _hid_idle_time():
+    """Return IOHIDSystem's `HIDIdleTime` (reported in nanoseconds) in seconds."""
+    iokit = _load_iokit()
+    # The matching dictionary's +1 reference is consumed by this call.
+    entry = iokit["IOServiceGetMatchingService"](
+        _IO_MAIN_PORT_DEFAULT, iokit["IOServiceMatching"](b"IOHIDSystem")
+    )
+    if not entry:
+        return None
+
+    try:
+        idle_ns = iokit["IORegistryEntryCreateCFProperty"](
+            entry, "HIDIdleTime", None, 0
+        )
+    finally:
+        iokit["IOObjectRelease"](entry)
+    return None if idle_ns is None else int(idle_ns) / 1e9
+
 
 # ---------------------------
 # Low-level async wrappers
 # ---------------------------
+# NOTE: Both delays are read on every poll (several times per stage detection)
+# but only change when the user edits their settings, so each is cached briefly
+# instead of re-reading preferences / spawning `pmset` every time.
+@async_ttl_cache(MACHINE_SETTINGS_TTL)
 async def get_screensaver_time():
     """
     Retrieve the system's screensaver idle delay (in seconds).
 
+    Reads the same per-host preference as
+    `defaults -currentHost read com.apple.screensaver idleTime`, but in-process.
+
     Returns:
         Optional[int]: The configured screensaver activation delay, or `None` if not available.
     """
     try:
-        cmd = ["defaults", "-currentHost", "read", "com.apple.screensaver", "idleTime"]
-        process = await run_async_process(cmd)
-        output = process.stdout
-        return int(output.strip())
+        # Refresh this process's preferences cache so edits made in System
+        # Settings since the last read are picked up.
+        CFPreferencesSynchronize(
+            _SCREENSAVER_DOMAIN, kCFPreferencesCurrentUser, kCFPreferencesCurrentHost
+        )
+        idle_time = CFPreferencesCopyValue(
+            "idleTime",
+            _SCREENSAVER_DOMAIN,
+            kCFPreferencesCurrentUser,
+            kCFPreferencesCurrentHost,
+        )
+        return int(idle_time)
     except (Exception, ValueError):
         # Avoid returning 0 for unset preferences (interpreted as disabled)
         pass
 
 
+@async_ttl_cache(MACHINE_SETTINGS_TTL)
 async def get_display_off_time(seconds: bool = True):
     """
     Retrieve display sleep time configured in macOS Power Management (pmset).
@@ -71,25 +183,51 @@ async def get_display_off_time(seconds: bool = True):
         Optional[int|float]: Display sleep duration in requested unit, or None if undetectable.
     """
     try:
+        # Output is kept as bytes; only the matched digits are ever needed.
         process = await run_async_process(["pmset", "-g"])
-        output = process.stdout
-        search_sleep_time = [
-            i.split()[1]
-            for i in output.splitlines()
-            if i.strip().startswith("displaysleep")
-        ]
+        search_sleep_time = _DISPLAYSLEEP_RE.search(process.stdout)
         if search_sleep_time:
-            sleep_time = int(search_sleep_time[0])
+            sleep_time = int(search_sleep_time.group(1))
             return sleep_time * TimeTypes.MINUTES if seconds else sleep_time
     except Exception:
         pass
 
 
+def _find_last_display_event(output: str, display_mode: str) -> Optional[str]:
+    """
+    Return the most recent `pmset -g log` row for a display "on"/"off" event.
+
+    The log can be megabytes long while only its newest matching row matters,
+    so rows are located newest-first with `str.rfind` and only those containing
+    the event text are checked against the full pattern.
+    """
+    needle = "Display is turned " + display_mode
+    pattern = _DISPLAY_EVENT_RES[display_mode]
+    end = len(output)
+
+    while (index := output.rfind(needle, 0, end)) != -1:
+        start = output.rfind("\n", 0, index) + 1
+        stop = output.find("\n", index)
+        line = output[start:] if stop == -1 else output[start:stop]
+        if pattern.search(line):
+            return line
+        end = start
+
+
+@async_ttl_cache(PMSET_LOG_TTL)
+async def _read_pmset_log() -> str:
+    """Return the text of `pmset -g log`, reused for a couple of seconds."""
+    proc = await run_async_process_text(["pmset", "-g", "log"])
+    return proc.stdout
+
+
 async def _get_display_log_details(
     display_is_turned_off: bool = False,
+    output: Optional[str] = None,
 ) -> SerializedNamespace:
     """
     Extract the most recent display on/off event from `pmset -g log`.
+    An already captured log `output` may be passed to avoid running `pmset` again.
 
     Returns a SerializedNamespace with:
       - event_date: datetime | None
@@ -103,16 +241,15 @@ async def _get_display_log_details(
     ns.is_reached = False
 
     try:
-        proc = await run_async_process(["pmset", "-g", "log"])
-        output = proc.stdout
-        pattern = r".*Notification\s+Display is turned {}".format(display_mode_regex)
-        display_mode_detail = regex_findall(pattern, output)
-
-        if display_mode_detail:
-            last_event = display_mode_detail[-1]
-            # timestamp appears as "YYYY-MM-DD HH:MM:SS -zzzz"
+        if output is None:
+            output = await _read_pmset_log()
+        last_event = _find_last_display_event(output, display_mode_regex)
+
+        if last_event:
+            # timestamp appears as "YYYY-MM-DD HH:MM:SS -zzzz"; the fixed
+            # date/time fields are ISO 8601, so skip dateutil's fuzzy parser.
             last_event_date = last_event.split()[:2]
-            last_event_dt = date_parser(" ".join(last_event_date))
+            last_event_dt = datetime.fromisoformat(" ".join(last_event_date))
             ns.event_date = last_event_dt
             ns.total_seconds = await calculate_seconds_since_last_event(last_event_dt)
             ns.is_reached = ns.total_seconds is not None and ns.total_seconds <= 30
@@ -144,6 +281,22 @@ async def get_last_time_display_turned_off():
     return await _get_display_log_details(display_is_turned_off=True)
 
 
+async def get_last_display_events():
+    """
+    Return `(last_off, last_on)` display event details from a single `pmset -g log` run.
+    """
+    try:
+        output = await _read_pmset_log()
+    except Exception:
+        # Parse an empty log so both namespaces come back unset.
+        output = ""
+
+    return await asyncio.gather(
+        _get_display_log_details(display_is_turned_off=True, output=output),
+        _get_display_log_details(display_is_turned_off=False, output=output),
+    )
+
+
 # ---------------------------
 # System state checks
 # ---------------------------
@@ -156,6 +309,9 @@ async def is_display_active(check_if_still_off: bool = False) -> bool:
       2. Check if screensaver is running (async).
       3. Fallback: compare last-on / last-off timestamps from pmset logs.
 
+    Steps 2 and 3 are only needed when Quartz is unavailable; their subprocesses
+    are then run concurrently rather than one after the other.
+
     Args:
         check_if_still_off: If True, invert result to signal whether display is still off.
 
@@ -164,25 +320,32 @@ async def is_display_active(check_if_still_off: bool = False) -> bool:
     """
     # 1) Try Quartz API (non-blocking because we run it in executor)
     try:
-        active = await run_in_thread(CGDisplayIsActive, CGMainDisplayID())
+        active = await run_in_thread(_main_display_is_active)
         display_status = bool(active)
         return (not display_status) if check_if_still_off else display_status
     except Exception:
         # proceed to fallbacks
         pass
 
+    # Both fallbacks are independent; fetch them together.
+    screensaver_running, display_events = await asyncio.gather(
+        is_screensaver_running(),
+        # Both events come from one `pmset -g log` run.
+        get_last_display_events(),
+        return_exceptions=True,
+    )
+
     # 2) Screensaver check
-    try:
-        if await is_screensaver_running():
-            # If screensaver is running, treat display as "not active"
-            return not check_if_still_off
-    except Exception:
-        pass
+    if screensaver_running is True:
+        # If screensaver is running, treat display as "not active"
+        return not check_if_still_off
 
     # 3) Log-based inference (pmset)
     try:
-        last_off = await get_last_time_display_turned_off()
-        last_on = await get_last_time_display_turned_on()
+        if isinstance(display_events, BaseException):
+            raise display_events
+
+        last_off, last_on = display_events
         last_off_ts = last_off.event_date
         last_on_ts = last_on.event_date
 
@@ -205,16 +368,26 @@ async def is_screensaver_running():
     """
     Check if the macOS screensaver is currently active.
 
-    This asynchronous function uses AppleScript via the `osascript` command to determine
-    whether the macOS screensaver is running. It executes the AppleScript command in a
-    subprocess and parses the output to return a boolean value.
+    A locked session (read directly from the Quartz session dictionary) is treated
+    as the screensaver being active; with a password required, a running screensaver
+    locks the session. Otherwise this asynchronous function uses AppleScript via the
+    `osascript` command to determine whether the macOS screensaver is running. It
+    executes the AppleScript command in a subprocess and parses the output to return
+    a boolean value.
 
     Returns:
         bool: True if the screensaver is active, False otherwise. If the command fails
         or an exception occurs, it defaults to returning False.
     """
     try:
-        proc = await run_async_process(
+        # No subprocess needed while the screen is locked.
+        if _session_screen_is_locked():
+            return True
+    except Exception:
+        pass
+
+    try:
+        proc = await run_async_process_text(
             [
                 "osascript",
                 "-e",
@@ -236,31 +409,25 @@ async def current_idle_time() -> idleSeconds:
     """
     Return system idle time as an `idleSeconds` wrapper (Decimal seconds).
 
-    Primary: Quartz CGEventSourceSecondsSinceLastEventType (fast, wrapped in executor).
-    Fallback: `ioreg` query (shell) to obtain HIDIdleTime and divide by 1e9.
+    Primary: Quartz CGEventSourceSecondsSinceLastEventType (fast, called directly).
+    Fallback: IOKit registry read of IOHIDSystem's HIDIdleTime, divided by 1e9.
     Raises UndetectableIdleState if both fail.
     """
 
     def fallback_idle_time_sync():
         try:
-            shell_cmd = "ioreg -c IOHIDSystem | awk '/HIDIdleTime/ {print $NF/1000000000; exit}'"
-            proc = run_process(shell_cmd)
-            return float(proc.stdout.strip())
+            return _hid_idle_time()
         except Exception:
             return None
 
-    # Try Quartz API first (executed in thread to avoid any blocking)
-    try:
-        precise_idle = await run_in_thread(
-            CGEventSourceSecondsSinceLastEventType,
-            kCGEventSourceStateCombinedSessionState,
-            kCGAnyInputEventType,
-        )
-    except Exception:
-        precise_idle = None
+    # Try Quartz API first. It only reads the window server's cached event state
+    # and returns in microseconds, so it is called inline: an executor hop would
+    # cost more than the query itself. The call does not raise in steady state;
+    # a falsy result triggers the fallback.
+    precise_idle = _CG_IDLE(_SRC_STATE, _ANY_EVENT)
 
     if not precise_idle:
-        # fallback shell path (wrapped)
+        # fallback IOKit path (wrapped)
         precise_idle = await run_in_thread(fallback_idle_time_sync)
 
     if not precise_idle:
@@ -303,8 +470,7 @@ class MacOS(_MacOS):
                 f"Detected OS {machine!r} ❌ - this script is strictly built for MacOS (darwin) only."
             )
 
-        mac_version_tuple = tuple(int(v) for v in self.mac_version.split(".")[:2])
-        await compare_versions(self, mac_version_tuple)
+        compare_versions(self, self.mac_version_tuple)
 
     @classmethod
     def generate_log_file(cls, file_name: str = None):
@@ -336,6 +502,11 @@ class MacOS(_MacOS):
         """Return the macOS version string, e.g., '14.5'."""
         return get_mac_version()[0]
 
+    @cached_property
+    def mac_version_tuple(self):
+        """Return the `(major, minor)` macOS version, e.g., `(14, 5)`."""
+        return tuple(int(v) for v in self.mac_version.split(".")[:2])
+
     @cached_property
     def hostname(self):
         """Return short system hostname (without .local suffix)."""
@@ -377,8 +548,14 @@ class MacOS(_MacOS):
         """
         Return True only if both sleep and display-off modes are active.
         """
-        results = await asyncio.gather(
-            self.has_sleep_mode(), self.has_display_off_mode()
-        )
-        method = any if not verify_both_are_set else all
-        return method(results)
+        if verify_both_are_set:
+            has_sleep_mode, has_display_off_mode = await asyncio.gather(
+                self.has_sleep_mode(), self.has_display_off_mode()
+            )
+            return has_sleep_mode and has_display_off_mode
+
+        # Either mode is enough: the screensaver check is an in-process preference
+        # read, so `pmset` is only consulted when no screensaver delay is set.
+        if await self.has_sleep_mode():
+            return True
+        return await self.has_display_off_mode()
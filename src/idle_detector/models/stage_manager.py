@@ -27,6 +27,7 @@ class StageManager(Serializable):
     detect_screensaver_status: Optional[bool] = field(default=False)
 
     idle_seconds: idleSeconds = field(default=None, init=False)
+    activity_resumed: bool = field(default=False, init=False)
     idle_stage: idleStages = field(default=None, init=False)
     available_idle_stages: Iterable[idleStages] = field(
         default_factory=list, init=False
@@ -58,10 +59,16 @@ class StageManager(Serializable):
     def update_reference_timer(
         self, screensaver_time, display_off_time, reference_interval
     ):
-        self.reference_timers = SerializedNamespace(module="ReferenceTimers")
-        self.reference_timers.screensaver_time = screensaver_time
-        self.reference_timers.display_off_time = display_off_time
-        self.reference_timers.reference_interval = reference_interval
+        # The namespace is created once and updated in place on every poll,
+        # rather than reallocated for each iteration of the detection loop.
+        reference_timers = self.reference_timers
+        if reference_timers is None:
+            reference_timers = self.reference_timers = SerializedNamespace(
+                module="ReferenceTimers"
+            )
+        reference_timers.screensaver_time = screensaver_time
+        reference_timers.display_off_time = display_off_time
+        reference_timers.reference_interval = reference_interval
 
     def update_display_off_stage(self, total_seconds_before_waking_up, idle_stage):
         global DISPLAY_WAS_OFF
@@ -89,10 +96,19 @@ class StageManager(Serializable):
         )
 
         # Capture the latest measured idle time from the machine
+        previous_idle_seconds = self.idle_seconds
         self.idle_seconds = idle_seconds_obj
         machine_is_idle = idle_seconds_obj.is_idle()
         seconds = self.idle_seconds.seconds
 
+        # Idle time only ever grows until input arrives, so any drop since the
+        # previous poll means the user was active in between, even if they have
+        # gone idle again by now (a brief keypress between two long polls).
+        self.activity_resumed = (
+            previous_idle_seconds is not None
+            and seconds < previous_idle_seconds.seconds
+        )
+
         # --- Establish baseline stage if not yet set ---
         # Ensures a deterministic state before applying advanced mode logic.
         self.idle_stage = (
@@ -104,7 +120,7 @@ class StageManager(Serializable):
         # we only need to observe a single change from idle → active to emit a wake event.
         # This branch performs that one-time transition and preserves the last-known
         # idle duration so callers can reason about how long the system was idle before wake.
-        if DISPLAY_WAS_OFF and not machine_is_idle:
+        if DISPLAY_WAS_OFF and (not machine_is_idle or self.activity_resumed):
             # If the machine is no longer considered idle.
             # Flip the global flag so this path will not re-fire until a new display-off
             # event is observed; set the stage to WAKE_UP and return immediately so the
@@ -6,7 +6,7 @@ from ..utils.common import (
     compare_versions,
     date_parser,
     encode_string,
-    run_async_process,
+    run_async_process_text,
 )
 from ..utils.exceptions import MissingPackage
 from ..utils.os_modules import (
@@ -44,7 +44,7 @@ class TerminalNotifier:
 
         tn_version = await self.version
         tn_version_tuple = tuple(int(v) for v in tn_version.split("."))
-        await compare_versions(self, tn_version_tuple)
+        compare_versions(self, tn_version_tuple)
 
     async def notify(self, **terminal_notifier_kwargs):
         test_message = "This is a test notification from idle-detector."
@@ -62,7 +62,7 @@ class TerminalNotifier:
 
     async def execute_command(self, cmd):
         tn_cmd = (self.terminal_notifier_bin, *cmd)
-        return await run_async_process(tn_cmd)
+        return await run_async_process_text(tn_cmd)
 
     async def clear_notifications_by_group(self, *, group_type: GroupTypes):
         await self.execute_command(["-remove", group_type])
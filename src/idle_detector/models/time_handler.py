@@ -1,22 +1,46 @@
-from dataclasses import dataclass
 from datetime import timedelta
 from decimal import Decimal
-from functools import total_ordering
+from functools import lru_cache, total_ordering
 from typing import ClassVar
 
 from ..utils.common import IS_IDLE_START_TIME, to_seconds
 from ._dataclasses import TimeTypes
 
+# Unit labels aligned with (days, hours, minutes, seconds).
+_COMPACT_NAMES = ("d", "h", "m", "s")
+_FULL_NAMES = ("days", "hours", "minutes", "seconds")
+_FULL_SINGULAR_NAMES = ("day", "hour", "minute", "second")
+
+
+@lru_cache(maxsize=4096)
+def _format_duration(total_seconds: int, compact_name: bool) -> str:
+    """
+    Render whole seconds as "1h 1m 15s" or "1 hour 1 minute 15 seconds".
+    Memoized since idle polling repeatedly formats the same second counts.
+    """
+    # Clamp negatives to zero to avoid invalid time display
+    if total_seconds <= 0:
+        return "0s" if compact_name else "0 seconds"
+
+    # Break total seconds into (days, hours, minutes, seconds)
+    days, remainder = divmod(total_seconds, TimeTypes.DAYS)
+    hours, remainder = divmod(remainder, TimeTypes.HOURS)
+    minutes, seconds = divmod(remainder, TimeTypes.MINUTES)
+    parts = (days, hours, minutes, seconds)
+
+    # Only include non-zero components
+    if compact_name:
+        return " ".join(
+            f"{num}{_COMPACT_NAMES[i]}" for i, num in enumerate(parts) if num
+        )
+    return " ".join(
+        f"{num} {_FULL_SINGULAR_NAMES[i] if num == 1 else _FULL_NAMES[i]}"
+        for i, num in enumerate(parts)
+        if num
+    )
+
 
 @total_ordering
-@dataclass(
-    eq=False,
-    frozen=True,
-    match_args=False,
-    unsafe_hash=True,
-    slots=True,
-    weakref_slot=True,
-)
 class idleSeconds:
     """
     Immutable, type-safe representation of system idle duration in seconds.
@@ -74,11 +98,34 @@ class idleSeconds:
         comparison and formatted reporting across system components.
     """
 
+    __slots__ = ("seconds", "__weakref__")
+
     seconds: Decimal | float
 
     # Shared conversion helper across instances; avoids rebinding per object.
     to_seconds: ClassVar = staticmethod(to_seconds)
 
+    def __init__(self, seconds: Decimal | float):
+        # Plain slotted class instead of a frozen dataclass: construction is a
+        # single slot store rather than a trip through the frozen `__setattr__`.
+        object.__setattr__(self, "seconds", seconds)
+
+    def __setattr__(self, name, value):
+        raise AttributeError(f"cannot assign to field {name!r}")
+
+    def __delattr__(self, name):
+        raise AttributeError(f"cannot delete field {name!r}")
+
+    def __repr__(self):
+        return f"{type(self).__name__}(seconds={self.seconds!r})"
+
+    def __reduce__(self):
+        # Rebuild through `__init__` so copy/deepcopy/pickle bypass `__setattr__`.
+        return type(self), (self.seconds,)
+
+    def __hash__(self):
+        return hash(self.seconds)
+
     def __str__(self):
         return f"{self.to_seconds(self.seconds)}"
 
@@ -112,31 +159,4 @@ class idleSeconds:
         Convert seconds into a structured human-readable time string.
         Example: 3675s → "1h 1m 15s" or "1 hour 1 minute 15 seconds"
         """
-        total_seconds = int(self.seconds)
-
-        # Clamp negatives to zero to avoid invalid time display
-        if total_seconds < 0:
-            total_seconds = 0
-
-        # Zero duration → return immediate unit (e.g., "0s" or "0 seconds")
-        if total_seconds == 0:
-            return TimeTypes.SECONDS.format_time_value(
-                total_seconds, compact_name=compact_name
-            )
-
-        # Break total seconds into (days, hours, minutes, seconds)
-        days, remainder = TimeTypes.DAYS.divmod(total_seconds)
-        hours, remainder = TimeTypes.HOURS.divmod(remainder)
-        minutes, seconds = TimeTypes.MINUTES.divmod(remainder)
-
-        # Only include non-zero components; zip aligns each numeric with its TimeType
-        time_parts = [
-            t_type.format_time_value(num, compact_name=compact_name)
-            for num, t_type in zip(
-                (days, hours, minutes, seconds), TimeTypes, strict=True
-            )
-            if num > 0
-        ]
-
-        # Final string composition: "1h 2m 5s" or "1 hour 2 minutes 5 seconds"
-        return " ".join(time_parts)
+        return _format_duration(int(self.seconds), bool(compact_name))
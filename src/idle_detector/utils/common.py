@@ -2,13 +2,15 @@ import asyncio
 import re
 from datetime import datetime
 from decimal import Decimal
+from functools import partial, wraps
 from os import PathLike as _PathLike
+from time import monotonic
 from typing import Any, Callable, Union
 
 from dateutil.parser import parse
 
 from .exceptions import MachineNotSupported
-from .os_modules import run_process
+from .os_modules import run_process, run_process_text
 
 PathLike = Union[str, _PathLike]
 # Boolean flag indicating whether the display was turned off.
@@ -23,12 +25,27 @@ IS_IDLE_START_TIME = Decimal(1e-1)
 # Used as a placeholder for cases where no upper limit is defined.
 NULL_INFINITY = Decimal("inf")
 
-# Boolean flag to indicate whether the idle detector is currently running.
-# This is used to manage the state of the idle detection process.
-IDLE_DETECTOR_RUN = False
-
 PAUSE_DETECTION_TIMER = 0.1
 
+# Upper bound (in seconds) for the adaptive polling interval of the detection loop.
+# Kept below the 5-second lead of the SCREENSAVER threshold, the tightest gap
+# between stage thresholds, so a transition is never a whole interval late.
+MAX_PAUSE_DETECTION_TIMER = 2
+
+# Multiplier applied to the polling interval while the idle stage stays unchanged.
+PAUSE_BACKOFF_FACTOR = 1.5
+
+# Number of consecutive unchanged iterations before the polling interval backs off.
+PAUSE_BACKOFF_THRESHOLD = 3
+
+# How long (in seconds) configured machine settings (screensaver and display sleep
+# delays) are reused before the underlying command is run again.
+MACHINE_SETTINGS_TTL = 60
+
+# How long (in seconds) a captured `pmset -g log` output is reused. Display
+# on/off events are looked up several times within a single poll.
+PMSET_LOG_TTL = 2
+
 PROJECT = "idleDetector"
 
 
@@ -76,10 +93,6 @@ def regex_search(pattern: str, string: str):
     return regex_compiler(pattern).search(string)
 
 
-def regex_findall(pattern: str, string: str):
-    return regex_compiler(pattern).findall(string)
-
-
 def transform_encoding(message, decode: bool = False):
     method = "decode" if decode else "encode"
     str_func = getattr(message, method, None)
@@ -96,10 +109,6 @@ def decode_string(message):
     return transform_encoding(message, decode=True)
 
 
-def reverse_sort(items):
-    return sorted(items, reverse=True)
-
-
 def to_seconds(seconds):
     """
     Normalize a variety of time objects into raw seconds (float or Decimal).
@@ -116,6 +125,43 @@ def to_seconds(seconds):
     return seconds
 
 
+def async_ttl_cache(ttl: float):
+    """
+    Cache the results of a coroutine function for `ttl` seconds, keyed by arguments.
+    Unlike `lru_cache`, the awaited result (not the coroutine) is what gets stored.
+    Concurrent callers that miss the cache wait for a single underlying call.
+    """
+
+    def decorator(func):
+        cache = {}
+        lock = asyncio.Lock()
+
+        def lookup(key):
+            cached = cache.get(key)
+            if cached is not None and monotonic() - cached[0] < ttl:
+                return cached
+
+        @wraps(func)
+        async def wrapper(*args, **kwargs):
+            key = (args, tuple(kwargs.items()))
+            if (cached := lookup(key)) is not None:
+                return cached[1]
+
+            async with lock:
+                # Another caller may have refreshed the entry while this one waited.
+                if (cached := lookup(key)) is not None:
+                    return cached[1]
+
+                result = await func(*args, **kwargs)
+                cache[key] = (monotonic(), result)
+            return result
+
+        wrapper.cache_clear = cache.clear
+        return wrapper
+
+    return decorator
+
+
 async def run_in_thread(func: Callable[..., Any], *args, **kwargs) -> Any:
     """
     Run a synchronous callable in the default executor and return the result.
@@ -123,14 +169,19 @@ async def run_in_thread(func: Callable[..., Any], *args, **kwargs) -> Any:
     event loop is not blocked.
     """
     loop = asyncio.get_running_loop()
-    return await loop.run_in_executor(None, func, *args, **kwargs)
+    # `run_in_executor` only forwards positional arguments.
+    return await loop.run_in_executor(None, partial(func, *args, **kwargs))
 
 
 async def run_async_process(cmd, **kwargs):
     return await run_in_thread(run_process, cmd, **kwargs)
 
 
-async def compare_versions(self, detected_version):
+async def run_async_process_text(cmd, **kwargs):
+    return await run_in_thread(run_process_text, cmd, **kwargs)
+
+
+def compare_versions(self, detected_version):
     """
     Compare the detected version tuple against the minimum required version.
     Raises `MachineNotSupported` if the detected version is lower than required.
@@ -2,7 +2,13 @@ import importlib.resources as res
 import os
 import platform
 import shutil
+import stat
 import subprocess
+import sys
+from functools import lru_cache
+
+# Platform identifier (e.g. "darwin"), resolved once at import.
+_PLATFORM = sys.platform.lower()
 
 
 def add_executable_permissions(path):
@@ -14,14 +20,25 @@ def add_executable_permissions(path):
     os.chmod(path, new_permissions)
 
 
+@lru_cache(maxsize=32)
+def _which(package, sys_path):
+    return shutil.which(package, path=sys_path)
+
+
 def find_package(package, default=None):
-    return shutil.which(package) or default
+    # Keyed on the current PATH so lookups are redone only if PATH changes.
+    return _which(package, get_env("PATH")) or default
 
 
 def get_env(key, default=None):
     return os.getenv(key, default)
 
 
+def get_home_dir():
+    # `$HOME` avoids the passwd/DirectoryServices lookup done by `expanduser`.
+    return get_env("HOME") or os.path.expanduser("~")
+
+
 def get_mac_version():
     return platform.mac_ver()
 
@@ -35,7 +52,7 @@ def get_sys_path():
 
 
 def get_platform():
-    return platform.system().lower()
+    return _PLATFORM
 
 
 def get_project_path(path):
@@ -54,6 +71,11 @@ def is_file(fp):
     return os.path.isfile(fp)
 
 
+def is_regular_fd(fd):
+    # Same check as `is_file`, but on an open descriptor (one `fstat`, no path lookup).
+    return stat.S_ISREG(os.fstat(fd).st_mode)
+
+
 def copy_file(src, dst):
     shutil.copy(src, dst)
 
@@ -62,23 +84,48 @@ def rename(src, dst):
     os.rename(src, dst)
 
 
+def replace(src, dst):
+    os.replace(src, dst)
+
+
 def rm_file(fp):
-    if is_file(fp):
+    # Attempt the unlink directly rather than stat-ing the path first.
+    try:
         os.remove(fp)
+    except FileNotFoundError:
+        pass
 
 
-def run_process(cmd, **kwargs):
+def run_process(cmd, *, text=False, check=True, **kwargs):
+    # The child inherits the current environment by default; no copy is needed.
+    # Output is returned as raw bytes unless `text=True` is requested.
     default_kwargs = dict(
         stdout=subprocess.PIPE,
-        stderr=subprocess.STDOUT,
-        text=True,
-        check=True,
-        env=os.environ.copy(),
+        stderr=subprocess.DEVNULL,
+        text=text,
+        check=check,
     )
     default_kwargs.update(**kwargs)
     return subprocess.run(cmd, **default_kwargs)
 
 
+def run_process_text(cmd, **kwargs):
+    return run_process(cmd, text=True, **kwargs)
+
+
+def truncate(fp, size=0):
+    os.truncate(fp, size)
+
+
+def write_bytes(fp, data, mode=0o644):
+    # Single `write()` of a pre-built payload; no buffered file object needed.
+    fd = os.open(fp, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, mode)
+    try:
+        os.write(fd, data)
+    finally:
+        os.close(fd)
+
+
 def terminate(status=0):
     os._exit(status)
 
@@ -87,14 +134,20 @@ __all__ = (
     "add_executable_permissions",
     "find_package",
     "get_env",
+    "get_home_dir",
     "get_mac_version",
     "get_nodename",
     "get_platform",
     "get_project_path",
     "is_executable",
     "is_file",
+    "is_regular_fd",
     "rename",
+    "replace",
     "rm_file",
     "run_process",
+    "run_process_text",
     "terminate",
+    "truncate",
+    "write_bytes",
 )